@@ -226,9 +226,10 @@ class BuildManifest:
         if self._description is not None:
             manifest["description"] = self._description
 
+        # NOTE: Encoding to a string first means the file is written in one go
+        # rather than once for every token that json.dump() produces.
         path = Path(path)
-        with path.open("wt") as f:
-            json.dump(manifest, f, indent=4)
+        path.write_text(json.dumps(manifest, indent=4))
 
         self._source = path
 
@@ -252,8 +253,7 @@ class BuildManifest:
             if the build manifest could not be validated
         """
         path = Path(path)
-        with path.open("rt") as f:
-            parsed = json.load(f)
+        parsed = json.loads(path.read_bytes())
 
         errors = validate_object(parsed, Schema.BUILD_MANIFEST)
         if len(errors) != 0:
@@ -21,52 +21,53 @@ _logger = get_app_logger()
 
 class BuildTargetInfo(NamedTuple):
     target_type: Type[Target]
-    build: Callable[
-        [ServiceGroupDefinition, str, Config | None, str, Path, list[str]], None
-    ]
+    create: Callable[[str, Config | None, str, Path, list[str]], Target]
+    announce: Callable[[ServiceGroupDefinition], None]
 
 
-def _build_compose(
-    service_group: ServiceGroupDefinition,
+def _create_compose(
     manifest_name: str,
     config: Config | None,
     version: str,
     output: Path,
     options: list[str],
-) -> None:
+) -> Target:
+    return ComposeTarget(manifest_name, output, options=options)
+
+
+def _announce_compose(service_group: ServiceGroupDefinition) -> None:
     console = Console()
     console.print(
         f"Generating Docker Compose configuration for [blue bold]{service_group.name}[/blue bold]."
     )
-    ComposeTarget(manifest_name, output, options=options).build(service_group)
 
 
-def _build_image(
-    service_group: ServiceGroupDefinition,
+def _create_image(
     manifest_name: str,
     config: Config | None,
     version: str,
     output: Path,
     options: list[str],
-) -> None:
+) -> Target:
     if config is not None:
         namespace = config.registry_namespace
     else:
         _logger.info("Performing image build without a gantry configuration.")
         namespace = None
 
+    return ImageTarget(manifest_name, namespace, version, output, options=options)
+
+
+def _announce_image(service_group: ServiceGroupDefinition) -> None:
     console = Console()
     console.print(
         f"Building container images for [blue bold]{service_group.folder}[/blue bold]."
     )
-    ImageTarget(manifest_name, namespace, version, output, options=options).build(
-        service_group
-    )
 
 
 TARGETS: dict[str, "BuildTargetInfo"] = {
-    "compose": BuildTargetInfo(ComposeTarget, _build_compose),
-    "image": BuildTargetInfo(ImageTarget, _build_image),
+    "compose": BuildTargetInfo(ComposeTarget, _create_compose, _announce_compose),
+    "image": BuildTargetInfo(ImageTarget, _create_image, _announce_image),
 }
 
 
@@ -97,7 +98,7 @@ def _list_targets(ctx: click.Context, param: click.Parameter, value: bool) -> No
 
     console = Console()
 
-    for name, (target, _) in TARGETS.items():
+    for name, (target, _, _) in TARGETS.items():
         header = Table(width=80, box=None, show_header=False)
         header.add_column(width=16)
         header.add_column()
@@ -225,17 +226,21 @@ def cmd(
 
     if len(services_paths) == 0:
         _logger.info("No service groups were provided.  Nothing to build.")
+        return
+
+    # The same target instance is used for every service group so that any
+    # state it keeps, like the build manifest, is shared between them.
+    try:
+        builder = build_target.create(
+            manifest_name, opts.config, version, output_path, list(extra_options)
+        )
+    except GantryException as e:
+        raise CliException(f"Failed to create the `{target}` target: {str(e)}")
 
     for path in services_paths:
         try:
             service_group = load_service_group(path)
-            build_target.build(
-                service_group,
-                manifest_name,
-                opts.config,
-                version,
-                output_path,
-                extra_options,
-            )
+            build_target.announce(service_group)
+            builder.build(service_group)
         except GantryException as e:
             raise CliException(f"Failed to build {service_group.name}: {str(e)}")
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Callable, Collection, Iterator
 import logging
+import threading
 from typing import TypeVar
 
 from rich.console import Group
@@ -17,6 +19,49 @@ from rich.text import Text
 
 T = TypeVar("T")
 
+MAX_OUTPUT_LINES = 32
+"""The number of output lines an activity display shows at once."""
+
+
+class ConsoleOutput:
+    """The most recent lines of output from a process.
+
+    Only the last :data:`MAX_OUTPUT_LINES` lines are kept so the cost of
+    rendering the output doesn't grow with the amount a process produces.
+    """
+
+    def __init__(self, max_lines: int = MAX_OUTPUT_LINES) -> None:
+        """
+        Parameters
+        ----------
+        max_lines : int, optional
+            the number of lines to keep, by default :data:`MAX_OUTPUT_LINES`
+        """
+        self._lines: deque[Text] = deque(maxlen=max_lines)
+
+    def add_output(self, text: Text) -> None:
+        """Add some output, which may span several lines.
+
+        Parameters
+        ----------
+        text : :class:`rich.text.Text`
+            the output to add
+        """
+        self._lines.extend(text.split("\n"))
+
+    def clear(self) -> None:
+        """Remove all of the output."""
+        self._lines.clear()
+
+    def __rich__(self) -> Table:
+        table = Table.grid()
+        table.add_column()
+        # NOTE: Copying the lines first means output can still be added, by
+        # another thread, while the table is being rendered.
+        for line in tuple(self._lines):
+            table.add_row(line)
+        return table
+
 
 class ActivityDisplay(ABC):
     """Track the activity of a long-running process.
@@ -41,8 +86,9 @@ class ActivityDisplay(ABC):
             user-friendly name of the running process; this should be kept short
             as it gets prepended to the log output
         """
-        self._console_output = Table.grid()
+        self._console_output = ConsoleOutput()
         self._display: "ProcessDisplay" | None = None
+        self._display_group: Group | None = None
         self._logger = logger
         self._process_name = "console" if process_name is None else process_name
         self._surface = Live()
@@ -53,12 +99,12 @@ class ActivityDisplay(ABC):
         """Progress tracker for the individual task."""
 
     @abstractmethod
-    def _create_display_group(self, console_output: Table) -> Group:
+    def _create_display_group(self, console_output: ConsoleOutput) -> Group:
         """Create the display shown by this activity.
 
         Parameters
         ----------
-        console_output: :class:`rich.table.Table`
+        console_output: :class:`ConsoleOutput`
             the element where console output will be written to
         """
 
@@ -74,11 +120,14 @@ class ActivityDisplay(ABC):
         :class:`ProcessDisplay`
             the display context that a process uses to record its output
         """
-        console_output = Table.grid()
-        console_output.add_column()
+        # The display group is only created once; each new process just clears
+        # the output left behind by the previous one.
+        if self._display_group is None:
+            self._display_group = self._create_display_group(self._console_output)
 
+        self._console_output.clear()
         self._surface.start(refresh=True)
-        self._surface.update(self._create_display_group(console_output), refresh=True)
+        self._surface.update(self._display_group, refresh=True)
 
         if self._display is not None:
             return self._display
@@ -87,8 +136,9 @@ class ActivityDisplay(ABC):
             self._logger,
             self._process_name,
             self.task_progress,
-            console_output,
+            self._console_output,
             task_fields,
+            show_output=self._surface.console.is_terminal,
         )
 
         self._display.start()
@@ -109,11 +159,8 @@ class ActivityDisplay(ABC):
             self._display = None
 
         if clear_surface:
-            console_output = Table.grid()
-            console_output.add_column()
-            self._surface.update(
-                self._create_display_group(console_output), refresh=True
-            )
+            self._console_output.clear()
+            self._surface.refresh()
 
         if stop_surface:
             self._surface.stop()
@@ -166,7 +213,7 @@ class ConsoleActivityDisplay(ActivityDisplay):
     def task_progress(self) -> Progress:
         return self._task_progress
 
-    def _create_display_group(self, console_output: Table) -> Group:
+    def _create_display_group(self, console_output: ConsoleOutput) -> Group:
         return Group(
             self._task_progress,
             console_output,
@@ -236,7 +283,7 @@ class MultiActivityDisplay(ActivityDisplay):
     def task_progress(self) -> Progress:
         return self._task_progress
 
-    def _create_display_group(self, console_output: Table) -> Group:
+    def _create_display_group(self, console_output: ConsoleOutput) -> Group:
         return Group(
             self._total_progress,
             self._task_progress,
@@ -259,12 +306,36 @@ class MultiActivityDisplay(ActivityDisplay):
         self.stop(stop_surface=True)
 
 
+def _to_text(msg: str) -> Text:
+    """Convert process output into rich text.
+
+    Parsing ANSI escape codes is comparatively slow so it's skipped for the
+    (very common) case of output that doesn't contain any.
+
+    Parameters
+    ----------
+    msg : str
+        the process output
+
+    Returns
+    -------
+    :class:`rich.text.Text`
+        the output as rich text
+    """
+    if "\x1b" in msg:
+        return Text.from_ansi(msg)
+
+    # This matches how Text.from_ansi() splits up and rejoins lines.
+    return Text("\n".join(msg.splitlines()))
+
+
 class ProcessDisplay:
     """The display context for a :class:`ActivityDisplay`.
 
     The different :class:`ActivityDisplay` classes will provide a
     :class:`ProcessDisplay` for logging.  This should never be created directly
-    or stored for later use.
+    or stored for later use.  The output methods are thread-safe so a single
+    display can be shared by several workers.
     """
 
     def __init__(
@@ -272,13 +343,17 @@ class ProcessDisplay:
         logger: logging.Logger,
         tag: str,
         progress: Progress,
-        console_output: Table,
+        console_output: ConsoleOutput,
         task_fields: dict,
+        *,
+        show_output: bool = True,
     ) -> None:
         self._console_output = console_output
         self._had_error = False
+        self._lock = threading.Lock()
         self._logger = logger
         self._progress = progress
+        self._show_output = show_output
         self._started = False
         self._tag = tag
         self._task = TaskID(-1)
@@ -299,13 +374,19 @@ class ProcessDisplay:
         if not self._started:
             return
 
-        text = Text.from_ansi(msg)
-        self._logger.error("Error: %s", text.plain.strip())
-        self._had_error = True
+        text = _to_text(msg)
+        with self._lock:
+            self._logger.error("Error: %s", text.plain.strip())
+            self._had_error = True
 
     def print_output(self, msg: str) -> None:
         """Print the normal process output.
 
+        The message may contain several lines of output.  They are added to the
+        display as a single update but are logged one line at a time.  Output is
+        only logged, and not added to the display, if the console isn't a
+        terminal since the display would never render it.
+
         Parameter
         ---------
         msg : str
@@ -314,10 +395,13 @@ class ProcessDisplay:
         if not self._started:
             return
 
-        text = Text.from_ansi(msg)
-        self._logger.debug("<<%s>> %s", self._tag, text.plain.strip())
-        self._console_output.add_row(text)
-        self._progress.update(self._task)
+        text = _to_text(msg)
+        with self._lock:
+            for line in text.plain.split("\n"):
+                self._logger.debug("<<%s>> %s", self._tag, line.strip())
+            if self._show_output:
+                self._console_output.add_output(text)
+            self._progress.update(self._task)
 
     def start(self) -> "ProcessDisplay":
         """Start the display context.
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, KW_ONLY
+import functools
 import platform
 import subprocess
 from typing import cast, Literal, Iterator
@@ -6,7 +7,7 @@ from typing import cast, Literal, Iterator
 import docker  # type: ignore
 import docker.auth  # type: ignore
 import docker.errors  # type: ignore
-from docker.constants import DEFAULT_UNIX_SOCKET  # type: ignore
+from docker.constants import DEFAULT_MAX_POOL_SIZE, DEFAULT_UNIX_SOCKET  # type: ignore
 from docker.models.images import Image  # type: ignore
 from docker.tls import TLSConfig  # type: ignore
 
@@ -232,7 +233,9 @@ class Docker:
             yield PushStatus.create(item)
 
     @staticmethod
-    def create_low_level_api(*, url: str | None = None) -> docker.APIClient:
+    def create_low_level_api(
+        *, url: str | None = None, max_pool_size: int = DEFAULT_MAX_POOL_SIZE
+    ) -> docker.APIClient:
         """Create the Docker low-level API client.
 
         This will create an instance of :class:`docker.APIClient` that
@@ -249,6 +252,10 @@ class Docker:
             socket on Linux and will also check for
             ``~/.docker/run/docker.sock`` on macOS (in case this is running with
             Docker Desktop for macOS)
+        max_pool_size : int, optional
+            the maximum number of connections the client keeps open to the
+            daemon; this should be at least the number of threads that use the
+            client at the same time
 
         Returns
         -------
@@ -268,7 +275,43 @@ class Docker:
 
         try:
             _logger.debug("Create low-level Docker API client.")
-            return docker.APIClient(base_url=url)
+            return docker.APIClient(base_url=url, max_pool_size=max_pool_size)
         except docker.errors.DockerException as e:
             _logger.critical("Failed to create Docker API client.", exc_info=e)
             raise DockerConnectionError() from e
+
+    @staticmethod
+    def shared_low_level_api(
+        *, url: str | None = None, max_pool_size: int = DEFAULT_MAX_POOL_SIZE
+    ) -> docker.APIClient:
+        """Get a low-level API client that is shared across the application.
+
+        The client is created by :meth:`create_low_level_api` the first time
+        it's requested and the same instance is returned for every subsequent
+        call with the same URL and pool size.  The client pools its connections
+        to the daemon so it can be used from several threads at once.
+
+        Parameters
+        ----------
+        url : str, optional
+            URL for the client to connect to; see :meth:`create_low_level_api`
+        max_pool_size : int, optional
+            the maximum number of pooled connections; see
+            :meth:`create_low_level_api`
+
+        Returns
+        -------
+        :class:`docker.APIClient`
+            the shared low-level API client
+
+        Raises
+        ------
+        :exc:`DockerConnectionError`
+            if the client could not be created
+        """
+        return _get_shared_low_level_api(url, max_pool_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_shared_low_level_api(url: str | None, max_pool_size: int) -> docker.APIClient:
+    return Docker.create_low_level_api(url=url, max_pool_size=max_pool_size)
@@ -1,4 +1,5 @@
 from enum import Enum
+import functools
 from pathlib import Path
 from typing import Generic, TypeVar
 
@@ -10,6 +11,26 @@ from .exceptions import MissingTemplateError
 T = TypeVar("T")
 
 
+@functools.lru_cache(maxsize=256)
+def _get_environment(folder: Path) -> Environment:
+    """Get the Jinja environment used to load templates from a folder.
+
+    The environments are shared so that compiled templates are kept in Jinja's
+    template cache, which will reload a template if its file changes.
+
+    Parameters
+    ----------
+    folder : Path
+        folder containing the templates
+
+    Returns
+    -------
+    :class:`jinja2.Environment`
+        the template environment
+    """
+    return Environment(loader=FileSystemLoader(folder), autoescape=True)
+
+
 class PortType(Enum):
     """Defines the specific port type."""
 
@@ -88,9 +109,7 @@ class TemplateReference:
         str
             the rendered template
         """
-        env = Environment(loader=FileSystemLoader(self._path.parent), autoescape=True)
-
-        template = env.get_template(self._path.name)
+        template = _get_environment(self._path.parent).get_template(self._path.name)
         return template.render(ctx)
 
 
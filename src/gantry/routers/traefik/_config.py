@@ -5,6 +5,7 @@ class TraefikConfig:
         self._enable_tls: bool = False
         self._port: int | None = None
         self._routes: list[str] | None = None
+        self._rule: str | None = None
         self._service: str | None = None
 
     def add_route(self, route: str) -> None:
@@ -20,6 +21,14 @@ class TraefikConfig:
         if route in self._routes:
             raise ValueError(f"Already defined route `{route}`.")
         self._routes.append(route)
+        self._rule = None
+
+    def _route_rule(self) -> str:
+        """Get the routing rule, only rendering it when the routes change."""
+        if self._rule is None:
+            routes = [] if self._routes is None else self._routes
+            self._rule = " || ".join(f"PathPrefix(`{route}`)" for route in routes)
+        return self._rule
 
     def set_enable_tls(self, enable_tls: bool) -> None:
         """Enable TLS termination on this service.
@@ -58,19 +67,21 @@ class TraefikConfig:
         dict
             a dictionary of labels
         """
-        labels: dict[str, str | int | bool] = {"traefik.enable": True}
-
-        if port := self._port:
-            labels[f"traefik.http.services.{name}.loadbalancer.server.port"] = port
-
-        if routes := self._routes:
-            route_str = " || ".join(f"PathPrefix(`{route}`)" for route in routes)
-            labels[f"traefik.http.routers.{name}.rule"] = route_str
-
-        if service := self._service:
-            labels[f"traefik.http.routers.{name}.service"] = service
-
-        if self._enable_tls:
-            labels[f"traefik.http.routers.{name}.tls"] = True
-
-        return labels
+        router = f"traefik.http.routers.{name}"
+
+        port_label = (
+            {f"traefik.http.services.{name}.loadbalancer.server.port": self._port}
+            if self._port
+            else {}
+        )
+        rule_label = {f"{router}.rule": self._route_rule()} if self._routes else {}
+        service_label = {f"{router}.service": self._service} if self._service else {}
+        tls_label = {f"{router}.tls": True} if self._enable_tls else {}
+
+        return {
+            "traefik.enable": True,
+            **port_label,
+            **rule_label,
+            **service_label,
+            **tls_label,
+        }
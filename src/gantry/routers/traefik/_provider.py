@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import shutil
 from typing import Any, cast
@@ -13,12 +14,13 @@ TRAEFIK_IMAGE = "traefik:v2.10.1"
 TRAEFIK_CONFIG = "/etc/traefik/traefik.yml"
 
 
-# def _get_dynamic_config(args: dict) -> Path | None:
-#     value: str | None = args.get('dynamic-config')
-#     if value is None:
-#         return None
-#     else:
-#         return Path(value)
+def _get_dynamic_config(args: dict[str, Any]) -> str | None:
+    """Get the dynamic configuration folder, if it has been set.
+
+    The value is kept as a plain string since only its base name is needed
+    when generating the service definition.
+    """
+    return cast(str | None, args.get("dynamic-config"))
 
 
 class TraefikRoutingProvider(RoutingProvider):
@@ -28,7 +30,7 @@ class TraefikRoutingProvider(RoutingProvider):
         super().__init__(args)
 
     def copy_resources(self, services_folder: Path, output_folder: Path):
-        dynamic_config = cast(str | None, self._args.get("dynamic-config"))
+        dynamic_config = _get_dynamic_config(self._args)
         if dynamic_config is None:
             return
 
@@ -87,11 +89,11 @@ class TraefikRoutingProvider(RoutingProvider):
                 "external": self.args.get("socket", DOCKER_SOCKET),
             }
 
-        if dynamic_config := self.args.get("dynamic-config"):
-            name = Path(dynamic_config).name
+        if dynamic_config := _get_dynamic_config(self.args):
+            name = os.path.basename(os.path.normpath(dynamic_config))
             router_definition["files"]["dynamic-config"] = {  # type: ignore
                 "internal": f"/{name}",
-                "external": cast(str, dynamic_config),
+                "external": dynamic_config,
             }
 
         if enable_api or enable_dashboard:
@@ -119,6 +121,6 @@ class TraefikRoutingProvider(RoutingProvider):
             config.add_route(url)
 
         for key, value in config.to_labels(service.name).items():
-            service.set_metadata(key, value)
+            service.set_metadata(key, value, override=True)
 
         return service
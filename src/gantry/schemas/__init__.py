@@ -1,4 +1,5 @@
 from enum import Enum
+import functools
 import importlib.resources
 import json
 from typing import Iterator
@@ -31,9 +32,24 @@ def get_schema(schema: Schema) -> dict:
     """
     schema_file = f"{schema.value}.json"
     resource = importlib.resources.files(__package__).joinpath(schema_file)
-    with importlib.resources.as_file(resource) as path:
-        with path.open() as f:
-            return json.load(f)
+    return json.loads(resource.read_bytes())
+
+
+@functools.cache
+def _get_validator(schema: Schema) -> Draft7Validator:
+    """Create the validator for a schema, reusing it after the first call.
+
+    Parameters
+    ----------
+    schema : Schema
+        schema used for validation
+
+    Returns
+    -------
+    :class:`jsonschema.Draft7Validator`
+        the schema validator
+    """
+    return Draft7Validator(get_schema(schema))
 
 
 def validate_object(instance: dict, schema: Schema) -> list[ValidationError]:
@@ -46,7 +62,5 @@ def validate_object(instance: dict, schema: Schema) -> list[ValidationError]:
     schema : Schema
         schema used for validation
     """
-    schema_repr = get_schema(schema)
-    validator = Draft7Validator(schema_repr)
-    errors: Iterator[ValidationError] = validator.iter_errors(instance)
+    errors: Iterator[ValidationError] = _get_validator(schema).iter_errors(instance)
     return sorted(errors, key=lambda e: e.json_path)
@@ -1,65 +1,166 @@
 from abc import ABC
 from collections.abc import Collection
-import os.path
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import functools
+import os
 from pathlib import Path
+import threading
 from typing import Iterator, NamedTuple
 
 from ruamel.yaml import YAML
+from ruamel.yaml.main import CParser
 
 from .exceptions import (
     InvalidServiceDefinitionError,
-    MissingTemplateError,
     ServiceDefinitionNotFoundError,
     ServiceConfigurationException,
 )
 
+from .logging import get_app_logger
+
 from .resources import EnvironmentVariable, PathMapping, PortMapping, TemplateReference
 
 from .schemas import Schema, validate_object
 
 
-def _load_service_definition(folder: Path, ctx: dict) -> dict:
-    """Loads a service definition YAML file.
+_logger = get_app_logger("services")
+
+_SERVICE_FILES = ("service.yml", "service.yaml")
+"""Possible names of a service definition file, in order of preference."""
+
+# NOTE: The YAML parser is not thread-safe so each thread gets its own.
+_parsers = threading.local()
+
+
+@functools.cache
+def _check_yaml_backend() -> None:
+    """Warn, once, if the libyaml-based parser isn't available."""
+    if CParser is None:
+        _logger.warning(
+            "ruamel.yaml.clib is not installed; service definitions will be "
+            "parsed with the slower pure-Python YAML parser."
+        )
+
+
+def _get_yaml_parser() -> YAML:
+    """Get the YAML parser for the current thread."""
+    try:
+        return _parsers.yaml
+    except AttributeError:
+        _check_yaml_backend()
+        _parsers.yaml = YAML(typ="safe")
+        return _parsers.yaml
+
+
+def _load_yaml(document: str) -> dict:
+    """Parse a YAML document with the current thread's safe parser.
+
+    All YAML loading in this module should go through this function so that it
+    always uses the C-backed parser when available.
+
+    Parameters
+    ----------
+    document : str
+        the YAML document
+
+    Returns
+    -------
+    dict
+        the parsed document
+    """
+    return _get_yaml_parser().load(document)
+
+
+def _find_service_definition(folder: Path) -> tuple[str, int]:
+    """Find the service definition file within a folder.
 
     The method looks for a 'service.yml' or 'service.yaml' in the provided
-    folder.  The '.yml' extension is preferred and will checked first.
+    folder.  The '.yml' extension is preferred and will checked first.  A
+    single ``stat()`` call both checks for the file and gets its modification
+    time.
 
     Parameters
     ----------
     folder : Path
         path to the definitions folder
-    ctx : dict
-        dictionary containing information for rendering a service definition
 
     Returns
     -------
-    dict
-        contents of the definition file
+    tuple[str, int]
+        the name of the definition file and its modification time, in
+        nanoseconds
 
     Raises
     ------
     ServiceDefinitionNotFoundError
         if a valid service definition could not be found
     """
-    extensions = [".yml", ".yaml"]
-    service_file = Path("service")
-
-    yaml = YAML()
-
-    for extension in extensions:
+    for name in _SERVICE_FILES:
         try:
-            template = TemplateReference(folder, service_file.with_suffix(extension))
-            contents = template.render(ctx)
-            return yaml.load(contents)
-        except MissingTemplateError:
+            return name, os.stat(folder / name).st_mtime_ns
+        except FileNotFoundError:
             continue
 
     raise ServiceDefinitionNotFoundError(folder)
 
 
+def _load_service_definition(folder: Path, filename: str, ctx: dict) -> dict:
+    """Loads a service definition YAML file.
+
+    Parameters
+    ----------
+    folder : Path
+        path to the definitions folder
+    filename : str
+        name of the definition file within the folder
+    ctx : dict
+        dictionary containing information for rendering a service definition
+
+    Returns
+    -------
+    dict
+        contents of the definition file
+    """
+    template = TemplateReference(folder, Path(filename))
+    return _load_yaml(template.render(ctx))
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_cached_definition(
+    folder: Path, filename: str, name: str, mtime_ns: int
+) -> dict:
+    """Load a service definition, reusing any previously parsed definition.
+
+    The modification time is part of the cache key so that a definition file
+    is parsed again if it changes on disk.  The returned dictionary is shared
+    and must not be modified.
+
+    Parameters
+    ----------
+    folder : Path
+        resolved path to the definitions folder
+    filename : str
+        name of the definition file within the folder
+    name : str
+        the name of the folder, as provided by the caller
+    mtime_ns : int
+        modification time of the definition file
+
+    Returns
+    -------
+    dict
+        contents of the definition file
+    """
+    ctx = {"service": {"folder": os.path.join(".", name)}}
+    return _load_service_definition(folder, filename, ctx)
+
+
 class _ServiceDefinitionBase(ABC):
     """Base implementation of all service definitions."""
 
+    __slots__ = ("_definition", "_folder")
+
     def __init__(
         self,
         schema: Schema,
@@ -94,10 +195,11 @@ class _ServiceDefinitionBase(ABC):
         self._folder: Path | None
 
         if folder:
-            ctx = {"service": {"folder": os.path.join(".", folder.name)}}
-
-            self._definition = _load_service_definition(folder, ctx)
             self._folder = folder.resolve()
+            filename, mtime_ns = _find_service_definition(self._folder)
+            self._definition = copy.deepcopy(
+                _load_cached_definition(self._folder, filename, folder.name, mtime_ns)
+            )
         elif definition:
             self._definition = definition
             self._folder = None
@@ -122,6 +224,15 @@ class _ServiceDefinitionBase(ABC):
 class ServiceDefinition(_ServiceDefinitionBase):
     """Defines a single containerized service."""
 
+    # The derived properties are computed on first access and cached here.
+    __slots__ = (
+        "_entrypoint",
+        "_environment",
+        "_files",
+        "_service_ports",
+        "_volumes",
+    )
+
     class Entrypoint(NamedTuple):
         routes: list[str]
         listens_on: int
@@ -130,6 +241,11 @@ class ServiceDefinition(_ServiceDefinitionBase):
         self, *, folder: Path | None = None, definition: dict | None = None
     ) -> None:
         super().__init__(Schema.SERVICE, folder=folder, definition=definition)
+        self._entrypoint: ServiceDefinition.Entrypoint | None = None
+        self._environment: list[EnvironmentVariable] | None = None
+        self._files: dict[str, PathMapping] | None = None
+        self._service_ports: dict[str, PortMapping] | None = None
+        self._volumes: dict[str, str] | None = None
 
     @property
     def build_args(self) -> dict[str, str]:
@@ -139,6 +255,9 @@ class ServiceDefinition(_ServiceDefinitionBase):
     @property
     def entrypoint(self) -> Entrypoint:
         """The externally visible location of the service."""
+        if self._entrypoint is not None:
+            return self._entrypoint
+
         name = [f"/{self.name}"]
         port = 80
 
@@ -153,19 +272,28 @@ class ServiceDefinition(_ServiceDefinitionBase):
                 case _:
                     raise ValueError("Unknown datatype for service entrypoint.")
 
-        return ServiceDefinition.Entrypoint(name, port)
+        self._entrypoint = ServiceDefinition.Entrypoint(name, port)
+        return self._entrypoint
 
     @property
     def environment(self) -> list[EnvironmentVariable]:
         """A list of all environment variables to send to the container."""
-        env_vars: dict[str, str | int] = self._definition.get("environment", {})
-        return [EnvironmentVariable(key, value) for key, value in env_vars.items()]
+        if self._environment is None:
+            self._environment = [
+                EnvironmentVariable(key, value)
+                for key, value in self._definition.get("environment", {}).items()
+            ]
+        return self._environment
 
     @property
     def files(self) -> dict[str, PathMapping]:
         """A mapping of all files that should be mapped to the container."""
-        file_mapping = self._definition.get("files", {})
-        return {ref: PathMapping(details) for ref, details in file_mapping.items()}
+        if self._files is None:
+            file_mapping = self._definition.get("files", {})
+            self._files = {
+                ref: PathMapping(details) for ref, details in file_mapping.items()
+            }
+        return self._files
 
     @property
     def healthcheck(self) -> bool:
@@ -190,14 +318,21 @@ class ServiceDefinition(_ServiceDefinitionBase):
     @property
     def service_ports(self) -> dict[str, PortMapping]:
         """A mapping of all ports that should be exposed by the service."""
-        port_mapping = self._definition.get("service-ports", {})
-        return {ref: PortMapping(details) for ref, details in port_mapping.items()}
+        if self._service_ports is None:
+            port_mapping = self._definition.get("service-ports", {})
+            self._service_ports = {
+                ref: PortMapping(details) for ref, details in port_mapping.items()
+            }
+        return self._service_ports
 
     @property
     def volumes(self) -> dict[str, str]:
         """A mapping of all volumes requested by the service."""
-        vols: dict[str, str] = self._definition.get("volumes", {})
-        return {f"{self.name}-{vol_name}": path for vol_name, path in vols.items()}
+        if self._volumes is None:
+            vols: dict[str, str] = self._definition.get("volumes", {})
+            prefix = self.name + "-"
+            self._volumes = {prefix + vol_name: path for vol_name, path in vols.items()}
+        return self._volumes
 
     def set_metadata(
         self, key: str, value: str | int | bool, override: bool = False
@@ -221,15 +356,14 @@ class ServiceDefinition(_ServiceDefinitionBase):
         ValueError
             if ``override`` is ``False`` and ``key`` already exists
         """
-        if "metadata" not in self._definition:
-            self._definition["metadata"] = {}
+        metadata = self._definition.setdefault("metadata", {})
 
-        if key in self._definition and not override:
+        if not override and key in metadata:
             raise ValueError(
                 f"`{key}` is already specified in the definition's metadata."
             )
 
-        self._definition["metadata"][key] = value
+        metadata[key] = value
 
 
 class ServiceGroupDefinition(_ServiceDefinitionBase, Collection[ServiceDefinition]):
@@ -239,6 +373,9 @@ class ServiceGroupDefinition(_ServiceDefinitionBase, Collection[ServiceDefinitio
     :attr:`services` property or by iterating directly over the group.
     """
 
+    # The loaded services are cached here on first access.
+    __slots__ = ("_services",)
+
     class RouterInfo(NamedTuple):
         provider: str
         config: TemplateReference
@@ -246,6 +383,7 @@ class ServiceGroupDefinition(_ServiceDefinitionBase, Collection[ServiceDefinitio
 
     def __init__(self, folder: Path) -> None:
         super().__init__(Schema.SERVICE_GROUP, folder=folder)
+        self._services: dict[str, ServiceDefinition] | None = None
 
     @property
     def network(self) -> str:
@@ -267,11 +405,25 @@ class ServiceGroupDefinition(_ServiceDefinitionBase, Collection[ServiceDefinitio
 
     @property
     def services(self) -> dict[str, ServiceDefinition]:
-        """All of the services within the service group."""
-        return {
-            name: ServiceDefinition(folder=self.folder / name)
-            for name in self._definition["services"]
-        }
+        """All of the services within the service group.
+
+        The definitions are loaded concurrently on first access and the same
+        instances are then returned for the lifetime of the group.
+        """
+        if self._services is not None:
+            return self._services
+
+        if (folder := self.folder) is None:
+            self._services = {}
+            return self._services
+
+        names: list[str] = self._definition["services"]
+        with ThreadPoolExecutor() as executor:
+            services = executor.map(
+                lambda name: ServiceDefinition(folder=folder / name), names
+            )
+            self._services = dict(zip(names, services))
+        return self._services
 
     def __contains__(self, value: object) -> bool:
         return value in self._definition["services"]
@@ -282,9 +434,4 @@ class ServiceGroupDefinition(_ServiceDefinitionBase, Collection[ServiceDefinitio
         return len(self._definition["services"])
 
     def __iter__(self) -> Iterator[ServiceDefinition]:
-        if self.folder is None:
-            return
-
-        name: str
-        for name in self._definition["services"]:
-            yield ServiceDefinition(folder=self.folder / name)
+        yield from self.services.values()
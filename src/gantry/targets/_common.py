@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Protocol
+from concurrent.futures import ThreadPoolExecutor
+import os
+from typing import Iterable, Protocol
 import shutil
 
 from .. import routers
-from .._types import Path
+from .._types import Path, PathLike
+from ..build_manifest import BuildManifest, Entry
 from ..exceptions import BuildError
 from ..logging import get_app_logger
 from ..services import ServiceGroupDefinition
@@ -77,23 +80,10 @@ class Target(ABC):
         if options is None:
             return
 
-        accepted_options = [name for name, _ in self.options()]
+        accepted_options = frozenset(name for name, _ in self.options())
         for opt in options:
-            parts = opt.split("=")
-
-            key = ""
-            value = ""
-
-            match len(parts):
-                case 1:
-                    key = parts[0]
-                case 2:
-                    key = parts[0]
-                    value = parts[1]
-                case _:
-                    raise BuildError(
-                        'Target option must be a string or a "key=value" format.'
-                    )
+            # Anything after the first '=' is the option's value.
+            key, _, value = opt.partition("=")
 
             if len(key) == 0:
                 raise BuildError("Target option cannot be an empty string.")
@@ -118,6 +108,50 @@ class Target(ABC):
         """Returns a list of options that the target can accept."""
 
 
+class ManifestFile:
+    """A build manifest that is kept in memory between pipeline runs.
+
+    The manifest is only read from disk the first time it's updated.  Any
+    subsequent updates are applied to the in-memory copy before it's saved, so
+    building several service groups with the same target doesn't re-parse and
+    re-validate the manifest for every group.
+    """
+
+    def __init__(self, manifest_name: str, build_folder: Path) -> None:
+        """
+        Parameters
+        ----------
+        manifest_name : str
+            name to use if a new manifest needs to be created
+        build_folder : Path
+            the folder containing the manifest file
+        """
+        self._manifest: BuildManifest | None = None
+        self._manifest_name = manifest_name
+        self._path = build_folder / MANIFEST_FILE
+
+    def update(self, entries: Iterable[Entry]) -> None:
+        """Add entries to the manifest and save it.
+
+        Parameters
+        ----------
+        entries : iterable of :class:`Entry`
+            the entries to append to the manifest
+        """
+        if self._manifest is None:
+            if self._path.exists():
+                self._manifest = BuildManifest.load(self._path)
+                _logger.debug("Updating manifest at '%s'", self._path)
+            else:
+                self._manifest = BuildManifest(self._manifest_name)
+                _logger.debug("Generating manifest at '%s'", self._path)
+
+        for entry in entries:
+            self._manifest.append_entry(entry)
+
+        self._manifest.save(self._path)
+
+
 class CopyServiceResources:
     """Pipeline stage to copy the service resource folders.
 
@@ -125,8 +159,21 @@ class CopyServiceResources:
     in a build pipeline.
     """
 
-    def __init__(self, folder: Path, *, use_group_name: bool = False) -> None:
+    def __init__(
+        self, folder: Path, *, use_group_name: bool = False, link: bool = False
+    ) -> None:
+        """
+        Parameters
+        ----------
+        folder : Path
+            the folder the resources are copied into
+        use_group_name : bool
+            copy into ``folder/group-name`` instead of ``folder``
+        link : bool
+            hard link files instead of copying them, when possible
+        """
         self._folder = folder
+        self._link = link
         self._use_group_name = use_group_name
 
     def run(self, service_group: ServiceGroupDefinition) -> None:
@@ -136,7 +183,7 @@ class CopyServiceResources:
             folder = self._folder
 
         _logger.debug("Copying service resources to '%s'.", folder)
-        copy_services_resources(service_group, folder)
+        copy_services_resources(service_group, folder, link=self._link)
 
 
 class CreateBuildFolder:
@@ -158,15 +205,99 @@ class CreateBuildFolder:
 
         if self._overwrite:
             _logger.debug("Overwriting existing build folder at %s.", output)
-        elif output.exists():
+
+        try:
+            output.mkdir(parents=True, exist_ok=self._overwrite)
+        except FileExistsError as e:
             _logger.error("The `%s` folder already exists.", output)
-            raise BuildError("Folder already exists.")
+            raise BuildError("Folder already exists.") from e
+
+
+def _copy_resource(src: os.DirEntry[str], dst: Path, link: bool) -> None:
+    """Copy a single file or folder from a service folder.
+
+    Parameters
+    ----------
+    src : :class:`os.DirEntry`
+        directory entry for the file or folder being copied
+    dst : Path
+        the destination path
+    link : bool
+        hard link files rather than copying them
+    """
+    base_copy = _link_or_copy if link else shutil.copy2
+
+    def copy_function(src: PathLike, dst: PathLike) -> PathLike:
+        # This also covers files an earlier build already hard linked.
+        if _is_unchanged(src, dst):
+            return dst
+        return base_copy(src, dst)
+
+    if src.is_dir():
+        shutil.copytree(src.path, dst, dirs_exist_ok=True, copy_function=copy_function)
+    else:
+        copy_function(src.path, dst)
+
+
+def _is_unchanged(src: PathLike, dst: PathLike) -> bool:
+    """Check if a previously copied file is still identical to its source.
 
-        output.mkdir(parents=True, exist_ok=self._overwrite)
+    Both copying with :func:`shutil.copy2` and hard linking preserve the
+    modification time, so a destination with the same size and modification
+    time as the source is assumed to be unchanged.
+
+    Parameters
+    ----------
+    src : path-like
+        the file being copied
+    dst : path-like
+        the destination path
+
+    Returns
+    -------
+    bool
+        ``True`` if the destination exists and matches the source
+    """
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return False
+
+    src_stat = os.stat(src)
+    return (
+        src_stat.st_size == dst_stat.st_size
+        and src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+    )
+
+
+def _link_or_copy(src: PathLike, dst: PathLike) -> PathLike:
+    """Hard link a file, falling back to a regular copy if that isn't possible.
+
+    A link fails if the source and destination are on different devices or
+    the file system doesn't support hard links.  The copy is done with
+    :func:`shutil.copy2`, which uses the platform's fast-copy path.
+
+    Parameters
+    ----------
+    src : path-like
+        the file being copied
+    dst : path-like
+        the destination path
+
+    Returns
+    -------
+    path-like
+        the destination path
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
 
 
 def copy_services_resources(
-    service_group: ServiceGroupDefinition, folder: Path
+    service_group: ServiceGroupDefinition, folder: Path, *, link: bool = False
 ) -> None:
     """Copy the service resources into the output folder.
 
@@ -176,6 +307,10 @@ def copy_services_resources(
         service group being generated
     folder : Path
         path to output folder
+    link : bool, optional
+        hard link the resource files instead of copying them, by default
+        ``False``; the output then shares its files with the service folders
+        so any changes made to one will appear in the other
     """
     if services_folder := service_group.folder:
         router = routers.PROVIDERS[service_group.router.provider](
@@ -183,21 +318,34 @@ def copy_services_resources(
         )
         router.copy_resources(services_folder, folder)
 
+    # The output folders are created up front so that the copies themselves,
+    # which are I/O bound, can be run concurrently.
+    copies: list[tuple[os.DirEntry[str], Path, bool]] = []
     for service in service_group:
         if service.folder is None:
             break
 
-        contents = filter(lambda p: p.name != "service.yml", service.folder.iterdir())
-
         dst_folder = folder / service.name
         dst_folder.mkdir(exist_ok=True)
 
-        for src in contents:
-            dst = dst_folder / src.name
-            if src.is_dir():
-                shutil.copytree(src, dst, dirs_exist_ok=True)
-            else:
-                shutil.copy2(src, dst)
+        # Hard links only work within a single device so skip trying to link
+        # each file if the service's output folder is somewhere else.
+        use_link = link and os.stat(service.folder).st_dev == os.stat(dst_folder).st_dev
+
+        with os.scandir(service.folder) as contents:
+            copies.extend(
+                (src, dst_folder / src.name, use_link)
+                for src in contents
+                if src.name != "service.yml"
+            )
+
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(_copy_resource, src, dst, use_link)
+            for src, dst, use_link in copies
+        ]
+        for future in futures:
+            future.result()
 
 
 def resolve_build_folder(
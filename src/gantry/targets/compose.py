@@ -1,17 +1,19 @@
+from itertools import chain
+import json
 from typing import NamedTuple
 
 from ._common import (
     CopyServiceResources,
     CreateBuildFolder,
+    ManifestFile,
     Pipeline,
     Target,
-    MANIFEST_FILE,
 )
 
 from .. import routers
 from .._compose_spec import ComposeService
 from .._types import Path, PathLike
-from ..build_manifest import BuildManifest, DockerComposeEntry
+from ..build_manifest import DockerComposeEntry
 from ..exceptions import ComposeServiceBuildError
 from ..logging import get_app_logger
 from ..services import ServiceDefinition, ServiceGroupDefinition
@@ -62,18 +64,21 @@ def _convert_to_compose_service(
         if build_args := service.build_args:
             compose_service["build"]["args"] = build_args
 
-    compose_service["environment"] = {
-        var.key: str(var.value) for var in service.environment
-    }
+    # Only non-empty values are added to the compose service.
+    if environment := {var.key: str(var.value) for var in service.environment}:
+        compose_service["environment"] = environment
+
     compose_service["restart"] = "unless-stopped"
 
-    compose_service["ports"] = [str(port) for port in service.service_ports.values()]
+    if ports := list(map(str, service.service_ports.values())):
+        compose_service["ports"] = ports
 
     compose_service["networks"] = [network]
 
-    compose_service["volumes"] = []
-    compose_service["volumes"].extend(str(f) for f in service.files.values())
-    compose_service["volumes"].extend(f"{k}:{v}" for k, v in service.volumes.items())
+    volumes = list(map(str, service.files.values()))
+    volumes.extend(f"{k}:{v}" for k, v in service.volumes.items())
+    if volumes:
+        compose_service["volumes"] = volumes
 
     if not service.healthcheck:
         compose_service["healthcheck"] = {"disable": True}
@@ -81,31 +86,57 @@ def _convert_to_compose_service(
     if metadata := service.metadata:
         compose_service["labels"] = metadata
 
-    empty_keys = []
-    for key in compose_service:
-        if len(compose_service[key]) == 0:  # type: ignore
-            empty_keys.append(key)
+    return ConvertedDefinition(service.name, compose_service)
 
-    for key in empty_keys:
-        del compose_service[key]  # type: ignore
 
-    return ConvertedDefinition(service.name, compose_service)
+def _write_if_changed(path: Path, contents: str) -> bool:
+    """Write to a file only if its contents would change.
+
+    Leaving an identical file untouched preserves its modification time, which
+    anything watching the build folder may rely on.
+
+    Parameters
+    ----------
+    path : Path
+        path to the file
+    contents : str
+        the new file contents
+
+    Returns
+    -------
+    bool
+        ``True`` if the file was written
+    """
+    try:
+        if path.read_text() == contents:
+            return False
+    except FileNotFoundError:
+        pass
+
+    path.write_text(contents)
+    return True
 
 
 class BuildComposeFile:
     """Pipeline stage to build a Docker Compose file from a service group definition."""
 
-    def __init__(self, build_folder: Path) -> None:
+    def __init__(self, build_folder: Path, *, as_json: bool = False) -> None:
         """
         Parameters
         ----------
         build_folder : path
             path to the top build folder
+        as_json : bool, optional
+            write the compose file as compact JSON instead of YAML, by default
+            ``False``
         """
         self._build_folder = build_folder
+        self._as_json = as_json
+        self._yaml = YamlSerializer()
 
     def run(self, service_group: ServiceGroupDefinition) -> None:
-        if service_group.router.provider not in routers.PROVIDERS:
+        provider = routers.PROVIDERS.get(service_group.router.provider)
+        if provider is None:
             raise ComposeServiceBuildError(
                 f"Unknown routing provider `{service_group.router.provider}`."
             )  # noqa: E501
@@ -116,10 +147,10 @@ class BuildComposeFile:
         # file to the router.
         router_args = service_group.router.args.copy()
         router_args["config-file"] = service_group.router.config.path.name
-        router = routers.PROVIDERS[service_group.router.provider](router_args)
+        router = provider(router_args)
 
         services = map(
-            router.register_service, [router.generate_service()] + list(service_group)
+            router.register_service, chain((router.generate_service(),), service_group)
         )
 
         service_mapping: dict[str, ComposeService] = {}
@@ -129,20 +160,24 @@ class BuildComposeFile:
                 service, service_group.network
             )
             service_mapping[compose_service.name] = compose_service.description
-
-            for volume in service.volumes.keys():
-                volumes.add(volume)
+            volumes.update(service.volumes)
 
         compose_spec = {
             "services": service_mapping,
             "networks": {service_group.network: None},
-            "volumes": {volume: None for volume in volumes},
+            "volumes": dict.fromkeys(sorted(volumes)),
         }
 
-        yaml = YamlSerializer()
-        yaml.to_file(compose_spec, compose_file)
+        # NOTE: JSON is valid YAML so Docker Compose will accept the file as-is.
+        if self._as_json:
+            contents = json.dumps(compose_spec, separators=(",", ":"))
+        else:
+            contents = self._yaml.to_string(compose_spec)
 
-        _logger.debug("Built compose file to '%s'", compose_file)
+        if _write_if_changed(compose_file, contents):
+            _logger.debug("Built compose file to '%s'", compose_file)
+        else:
+            _logger.debug("Compose file at '%s' is unchanged.", compose_file)
 
 
 class BuildRouterConfig:
@@ -158,8 +193,7 @@ class BuildRouterConfig:
         }
 
         config_file = self._output / service_group.name / router.config.path.name
-        with config_file.open("wt") as f:
-            f.write(router.config.render(context))
+        config_file.write_bytes(router.config.render(context).encode("utf-8"))
 
         _logger.debug("Built router config to '%s'", config_file)
 
@@ -167,23 +201,12 @@ class BuildRouterConfig:
 class GenerateOrUpdateManifestFile:
     def __init__(self, manifest_name: str, build_folder: Path) -> None:
         self._build_folder = build_folder
-        self._manifest_name = manifest_name
+        self._manifest = ManifestFile(manifest_name, build_folder)
 
     def run(self, service_group: ServiceGroupDefinition) -> None:
         compose_file = self._build_folder / service_group.name / "docker-compose.yml"
-        manifest_json = self._build_folder / MANIFEST_FILE
-
         entry = DockerComposeEntry(compose_file.relative_to(self._build_folder), True)
-
-        try:
-            manifest = BuildManifest.load(manifest_json)
-            manifest.append_entry(entry)
-            manifest.save(manifest_json)
-            _logger.debug("Updated manifest at '%s'", manifest_json)
-        except FileNotFoundError:
-            manifest = BuildManifest(self._manifest_name, entries=[entry])
-            manifest.save(manifest_json)
-            _logger.debug("Generated manifest at '%s'", manifest_json)
+        self._manifest.update([entry])
 
 
 class ComposeTarget(Target):
@@ -196,13 +219,14 @@ class ComposeTarget(Target):
         self._output = Path(output)
 
         overwrite = "overwrite" in self._parsed_options
+        as_json = "json" in self._parsed_options
 
         self._pipeline = Pipeline(
             stages=[
                 CreateBuildFolder(
                     self._output, overwrite=overwrite, use_group_name=True
                 ),
-                BuildComposeFile(self._output),
+                BuildComposeFile(self._output, as_json=as_json),
                 BuildRouterConfig(self._output),
                 CopyServiceResources(self._output, use_group_name=True),
                 GenerateOrUpdateManifestFile(manifest_name, self._output),
@@ -220,6 +244,14 @@ class ComposeTarget(Target):
     @staticmethod
     def options() -> list[tuple[str, str]]:
         return [
+            (
+                "json",
+                (
+                    "Write the Docker Compose file as compact JSON rather than "
+                    "YAML.  This is faster for large service groups but the "
+                    "file is no longer human-friendly."
+                ),
+            ),
             (
                 "overwrite",
                 (
@@ -228,5 +260,5 @@ class ComposeTarget(Target):
                     "avoid writing over any existing files in the build "
                     "directory."
                 ),
-            )
+            ),
         ]
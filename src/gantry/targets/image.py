@@ -1,24 +1,45 @@
-from typing import Iterator
+from concurrent.futures import as_completed, ThreadPoolExecutor
+import hashlib
+import os
+import queue
+import threading
+from typing import Iterator, NamedTuple
+
+import docker  # type: ignore
+import docker.errors  # type: ignore
+import docker.utils  # type: ignore
+from docker.constants import DEFAULT_MAX_POOL_SIZE  # type: ignore
 
 from ._common import (
     CopyServiceResources,
     CreateBuildFolder,
+    ManifestFile,
     Pipeline,
     Target,
-    MANIFEST_FILE,
 )
 
 from .._types import Path, PathLike
-from ..build_manifest import BuildManifest, Entry, ImageEntry
-from ..console import MultiActivityDisplay
+from ..build_manifest import ImageEntry
+from ..console import ConsoleActivityDisplay, MultiActivityDisplay, ProcessDisplay
 from ..docker import Docker
-from ..exceptions import ServiceImageBuildError
+from ..exceptions import BuildError, ServiceImageBuildError
 from ..logging import get_app_logger
 from ..services import ServiceDefinition, ServiceGroupDefinition
 
 
 _logger = get_app_logger("build-image")
 
+_DEFAULT_MAX_WORKERS = 4
+"""Number of concurrent image builds when 'parallel' is given without a value."""
+
+_CONTEXT_DIGEST_LABEL = "gantry.context-sha256"
+"""Image label holding the digest of the context the image was built from."""
+
+_DEFAULT_DOCKERIGNORE = "\n".join(
+    ["**/.git", "**/.hg", "**/.svn", "**/__pycache__", "**/*.py[cod]", ""]
+)
+"""Contents of the '.dockerignore' added to services that don't provide one."""
+
 
 def _create_image_name(
     namespace: str | None, tag: str, service: ServiceDefinition
@@ -29,54 +50,370 @@ def _create_image_name(
     return image_name
 
 
+def _batch_build_output(
+    response: Iterator[dict[str, str]], max_size: int = 64
+) -> Iterator[list[dict[str, str]]]:
+    """Group the output from a Docker build into batches.
+
+    The response is read on a separate thread.  Each batch holds whatever output
+    arrived since the previous batch, up to ``max_size`` items, so output is
+    never held back waiting for more of it to arrive.
+
+    Parameters
+    ----------
+    response : iterator of dict
+        the decoded output from the Docker build API
+    max_size : int, optional
+        the maximum number of items in a batch, by default 64
+
+    Yields
+    ------
+    list of dict
+        a batch of build output items
+    """
+    items: queue.Queue[dict[str, str] | BaseException | None] = queue.Queue()
+
+    def read_response() -> None:
+        try:
+            for item in response:
+                items.put(item)
+        except BaseException as e:
+            items.put(e)
+        items.put(None)
+
+    threading.Thread(target=read_response, daemon=True).start()
+
+    finished = False
+    while not finished:
+        batch: list[dict[str, str]] = []
+        item = items.get()
+        while True:
+            if item is None:
+                finished = True
+                break
+
+            if isinstance(item, BaseException):
+                raise item
+
+            batch.append(item)
+            if len(batch) == max_size:
+                break
+
+            try:
+                item = items.get_nowait()
+            except queue.Empty:
+                break
+
+        if batch:
+            yield batch
+
+
+class _ImageBuild(NamedTuple):
+    service: str
+    """Name of the service being built."""
+    image: str
+    """Full name of the image being built."""
+    context: str
+    """Path to the build context."""
+    cache_image: str | None
+    """Full name of the image used as a build cache, if any."""
+
+
+def _hash_build_context(context: str) -> str:
+    """Compute a digest over the contents of a build context.
+
+    The digest covers the path and contents of every file in the context but
+    not any file metadata.  It's recorded on the image and compared across
+    machines and checkouts, where modification times can differ even though
+    the contents are the same, e.g., in a fresh clone.
+
+    Parameters
+    ----------
+    context : str
+        path to the build context
+
+    Returns
+    -------
+    str
+        the hex-encoded SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(context):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            digest.update(os.path.relpath(path, context).encode())
+            digest.update(b"\0")
+            with open(path, "rb") as f:
+                digest.update(hashlib.file_digest(f, "sha256").digest())
+    return digest.hexdigest()
+
+
+def _get_context_digest(api: docker.APIClient, image: str) -> str | None:
+    """Get the build context digest recorded on an image.
+
+    Parameters
+    ----------
+    api : :class:`docker.APIClient`
+        the low-level Docker API client
+    image : str
+        the full name of the image
+
+    Returns
+    -------
+    str or None
+        the digest or ``None`` if the image doesn't exist or doesn't have one
+    """
+    try:
+        labels = api.inspect_image(image)["Config"]["Labels"]
+    except docker.errors.APIError:
+        return None
+    return (labels or {}).get(_CONTEXT_DIGEST_LABEL)
+
+
+def _pull_cache_image(api: docker.APIClient, image: str) -> None:
+    """Try to pull an image so it can be used as a build cache.
+
+    The pull is best-effort.  A missing image, or one that can't be pulled,
+    only means that the build won't have any cached layers to start from.
+
+    Parameters
+    ----------
+    api : :class:`docker.APIClient`
+        the low-level Docker API client
+    image : str
+        the full name of the image to pull
+    """
+    try:
+        api.pull(image)
+        _logger.debug("Pulled '%s' to use as a build cache.", image)
+    except docker.errors.APIError as e:
+        _logger.debug("Could not pull cache image '%s': %s", image, e)
+
+
 class BuildDockerImages:
     """Build Docker images for each service in a service group."""
 
-    def __init__(self, build_folder: Path, namespace: str | None, tag: str) -> None:
-        self._api = Docker.create_low_level_api()
-        self._build_folder = build_folder
+    def __init__(
+        self,
+        build_folder: Path,
+        namespace: str | None,
+        tag: str,
+        *,
+        cache_tag: str | None = None,
+        max_workers: int = 1,
+        network_mode: str | None = None,
+        rebuild: bool = False,
+        shm_size: int | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        build_folder : Path
+            path to the top build folder
+        namespace : str, optional
+            the namespace the images are placed under
+        tag : str
+            the tag applied to each image
+        cache_tag : str, optional
+            if provided, the images with this tag are pulled, when available,
+            and used as a layer cache for the build
+        max_workers : int, optional
+            the maximum number of images that can be built at the same time, by
+            default 1
+        network_mode : str, optional
+            the network that RUN instructions use during the build; uses
+            Docker's default if not provided
+        rebuild : bool, optional
+            always build the images, even if an existing image was built from an
+            identical build context, by default ``False``
+        shm_size : int, optional
+            the size, in bytes, of ``/dev/shm`` during the build; uses Docker's
+            default if not provided
+        """
+        self._api: docker.APIClient | None = None
+        self._build_folder = os.fspath(build_folder.absolute())
+        self._cache_tag = cache_tag
+        self._max_workers = max_workers
         self._namespace = namespace
+        self._network_mode = network_mode
+        self._rebuild = rebuild
+        self._shm_size = shm_size
         self._tag = tag
 
     def run(self, service_group: ServiceGroupDefinition) -> None:
-        def stage_fn(service: ServiceDefinition) -> str:
-            image_name = _create_image_name(self._namespace, self._tag, service)
-            return f"Image: [bold blue]{image_name}[/bold blue]"
+        # The client is only requested once there's something to build.  Its
+        # connection pool must be large enough for every worker to keep its
+        # connection to the daemon alive between requests.
+        if self._api is None:
+            self._api = Docker.shared_low_level_api(
+                max_pool_size=max(self._max_workers, DEFAULT_MAX_POOL_SIZE)
+            )
+
+        # Everything needed for each build is worked out once, up front.
+        group_folder = os.path.join(self._build_folder, service_group.name)
+        builds = [
+            _ImageBuild(
+                service.name,
+                _create_image_name(self._namespace, self._tag, service),
+                os.path.join(group_folder, service.name),
+                (
+                    None
+                    if self._cache_tag is None
+                    else _create_image_name(self._namespace, self._cache_tag, service)
+                ),
+            )
+            for service in service_group
+        ]
+
+        if self._max_workers > 1 and len(builds) > 1:
+            self._build_concurrently(self._api, builds)
+        else:
+            self._build_sequentially(self._api, builds)
+
+    def _build_concurrently(
+        self, api: docker.APIClient, builds: list[_ImageBuild]
+    ) -> None:
+        num_workers = min(self._max_workers, len(builds))
+        _logger.debug("Building images with %d workers.", num_workers)
+
+        # All builds report to the same display so each line of output is
+        # prefixed by the name of the service it came from.
+        with ConsoleActivityDisplay(
+            _logger, description="Building Services", process_name="Docker"
+        ) as reporter:
+            # The executor isn't used as a context manager since that would wait
+            # for every running build before a failure could be reported.
+            executor = ThreadPoolExecutor(max_workers=num_workers)
+            futures = [
+                executor.submit(
+                    self._build_image,
+                    api,
+                    build,
+                    reporter,
+                    prefix=f"{build.service} | ",
+                )
+                for build in builds
+            ]
+
+            # Fail as soon as any build fails.  Builds that haven't started yet
+            # are cancelled and the error is raised without waiting for the
+            # builds that are still running.
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+            executor.shutdown()
+
+    def _build_sequentially(
+        self, api: docker.APIClient, builds: list[_ImageBuild]
+    ) -> None:
+        def stage_fn(build: _ImageBuild) -> str:
+            return f"Image: [bold blue]{build.image}[/bold blue]"
 
         service_builds = MultiActivityDisplay(
-            service_group,
+            builds,
             _logger,
             description="Building Services",
             process_name="Docker",
             stage_fn=stage_fn,
         )
 
-        service: ServiceDefinition
-        for service, reporter in service_builds:
-            # Generate the image name.
-            name = service.name  # type: ignore
-            dockerfile_folder = (
-                (self._build_folder / service_group.name / name).absolute().as_posix()
-            )
-            image_name = _create_image_name(self._namespace, self._tag, service)
+        build: _ImageBuild
+        for build, reporter in service_builds:
+            self._build_image(api, build, reporter)
 
-            # Call the Docker API and record its output.
-            _logger.debug(
-                "Building image '%s' from '%s'", image_name, dockerfile_folder
-            )
-
-            response: Iterator[dict[str, str]] = self._api.build(
-                path=dockerfile_folder, tag=image_name, rm=True, decode=True
+    def _build_image(
+        self,
+        api: docker.APIClient,
+        build: _ImageBuild,
+        reporter: ProcessDisplay,
+        *,
+        prefix: str = "",
+    ) -> None:
+        # An existing image built from an identical context is reused instead
+        # of being rebuilt, unless a rebuild was requested.  The local image is
+        # checked first so the registry is only contacted if it's out of date.
+        digest = _hash_build_context(build.context)
+        if not self._rebuild and _get_context_digest(api, build.image) == digest:
+            _logger.debug("Reusing '%s'.", build.image)
+            reporter.print_output(
+                f"{prefix}Build context unchanged; using {build.image}"
             )
+            return
+
+        cache_from: list[str] | None = None
+        if build.cache_image is not None:
+            cache_from = [build.cache_image]
+            _pull_cache_image(api, build.cache_image)
+
+            cache_digest = _get_context_digest(api, build.cache_image)
+            if not self._rebuild and cache_digest == digest:
+                repository, _, tag = build.image.rpartition(":")
+                api.tag(build.cache_image, repository, tag)
+
+                _logger.debug("Reusing '%s' for '%s'.", build.cache_image, build.image)
+                reporter.print_output(
+                    f"{prefix}Build context unchanged; using {build.cache_image}"
+                )
+                return
+
+        # Call the Docker API and record its output.
+        _logger.debug("Building image '%s' from '%s'", build.image, build.context)
+
+        response: Iterator[dict[str, str]] = api.build(
+            path=build.context,
+            tag=build.image,
+            rm=True,
+            decode=True,
+            cache_from=cache_from,
+            labels={_CONTEXT_DIGEST_LABEL: digest},
+            network_mode=self._network_mode,
+            shmsize=self._shm_size,
+        )
 
-            for item in response:
+        # Output is forwarded to the display in batches to cut down on the
+        # per-line overhead for builds that produce a lot of output.
+        for batch in _batch_build_output(response):
+            lines: list[str] = []
+            for item in batch:
                 if stream := item.get("stream"):
-                    reporter.print_output(stream.strip())
+                    lines.append(prefix + stream.strip())
 
                 if error := item.get("error"):
-                    reporter.print_error(error)
+                    if lines:
+                        reporter.print_output("\n".join(lines))
+                    reporter.print_error(prefix + error)
                     raise ServiceImageBuildError()
 
+            if lines:
+                reporter.print_output("\n".join(lines))
+
+
+class GenerateDockerIgnoreFiles:
+    """Add a default ``.dockerignore`` to each service's build context.
+
+    This keeps version control metadata and Python bytecode out of the context
+    that gets sent to the Docker daemon.  Services that provide their own
+    ``.dockerignore`` are left unchanged.
+    """
+
+    def __init__(self, build_folder: Path) -> None:
+        self._build_folder = build_folder
+
+    def run(self, service_group: ServiceGroupDefinition) -> None:
+        group_folder = self._build_folder / service_group.name
+        for service in service_group:
+            ignore_file = group_folder / service.name / ".dockerignore"
+            if ignore_file.exists():
+                continue
+
+            ignore_file.write_text(_DEFAULT_DOCKERIGNORE)
+            _logger.debug("Generated '%s'", ignore_file)
+
 
 class GenerateOrUpdateManifestFile:
     """Generate a manifest file that specifies the versions of each service."""
@@ -84,32 +421,18 @@ class GenerateOrUpdateManifestFile:
     def __init__(
         self, manifest_name: str, build_folder: Path, namespace: str | None, tag: str
     ) -> None:
-        self._build_folder = build_folder
-        self._manifest_name = manifest_name
+        self._manifest = ManifestFile(manifest_name, build_folder)
         self._namespace = namespace
         self._tag = tag
 
     def run(self, service_group: ServiceGroupDefinition) -> None:
-        entries: list[Entry] = [
+        self._manifest.update(
             ImageEntry(
                 _create_image_name(self._namespace, self._tag, service),
-                Path(service_group.name) / service.name / "Dockerfile",
+                Path(service_group.name, service.name, "Dockerfile"),
             )
             for service in service_group
-        ]
-
-        manifest_json = self._build_folder / MANIFEST_FILE
-
-        try:
-            manifest = BuildManifest.load(manifest_json)
-            for entry in entries:
-                manifest.append_entry(entry)
-            manifest.save(manifest_json)
-            _logger.debug("Updated manifest at '%s'", manifest_json)
-        except FileNotFoundError:
-            manifest = BuildManifest(self._manifest_name, entries=entries)
-            manifest.save(manifest_json)
-            _logger.debug("Generated manifest at '%s'", manifest_json)
+        )
 
 
 class ImageTarget(Target):
@@ -127,14 +450,53 @@ class ImageTarget(Target):
         super().__init__(options=options)
         self._build_folder = Path(build_folder)
 
+        link_resources = "link-resources" in self._parsed_options
         overwrite = "overwrite" in self._parsed_options
+        rebuild = "rebuild" in self._parsed_options
         skip_build = "skip-build" in self._parsed_options
 
+        cache_tag = self._parsed_options.get("cache-from")
+        if cache_tag is not None and len(cache_tag) == 0:
+            raise BuildError("The 'cache-from' option requires an image tag.")
+
+        network_mode = self._parsed_options.get("build-network")
+        if network_mode is not None and len(network_mode) == 0:
+            raise BuildError("The 'build-network' option requires a network name.")
+
+        shm_size: int | None = None
+        if (shm := self._parsed_options.get("build-shm-size")) is not None:
+            try:
+                shm_size = docker.utils.parse_bytes(shm)
+            except docker.errors.DockerException as e:
+                raise BuildError(
+                    f"The 'build-shm-size' option must be a size, not '{shm}'."
+                ) from e
+
+            if shm_size <= 0:
+                raise BuildError(
+                    "The 'build-shm-size' option requires a positive size."
+                )
+
+        max_workers = 1
+        if (parallel := self._parsed_options.get("parallel")) is not None:
+            try:
+                max_workers = int(parallel) if parallel else _DEFAULT_MAX_WORKERS
+            except ValueError as e:
+                raise BuildError(
+                    f"The 'parallel' option must be an integer, not '{parallel}'."
+                ) from e
+
+            if max_workers < 1:
+                raise BuildError("The 'parallel' option must be at least 1.")
+
         stages: list[Pipeline.Stage] = [
             CreateBuildFolder(
                 self._build_folder, overwrite=overwrite, use_group_name=True
             ),
-            CopyServiceResources(self._build_folder, use_group_name=True),
+            CopyServiceResources(
+                self._build_folder, use_group_name=True, link=link_resources
+            ),
+            GenerateDockerIgnoreFiles(self._build_folder),
             GenerateOrUpdateManifestFile(
                 manifest_name, self._build_folder, namespace, tag
             ),
@@ -143,7 +505,18 @@ class ImageTarget(Target):
         if skip_build:
             _logger.info("Docker build stage will be skipped.")
         else:
-            stages.append(BuildDockerImages(self._build_folder, namespace, tag))
+            stages.append(
+                BuildDockerImages(
+                    self._build_folder,
+                    namespace,
+                    tag,
+                    cache_tag=cache_tag,
+                    max_workers=max_workers,
+                    network_mode=network_mode,
+                    rebuild=rebuild,
+                    shm_size=shm_size,
+                )
+            )
 
         self._pipeline = Pipeline(stages=stages)
 
@@ -158,6 +531,39 @@ class ImageTarget(Target):
     @staticmethod
     def options() -> list[tuple[str, str]]:
         return [
+            (
+                "build-network",
+                (
+                    "The network that RUN instructions use during a build, e.g. "
+                    "'build-network=host'.  Docker's default network is used "
+                    "if this isn't set."
+                ),
+            ),
+            (
+                "build-shm-size",
+                (
+                    "The size of /dev/shm during a build, e.g. "
+                    "'build-shm-size=1g'.  Docker's default size is used if "
+                    "this isn't set."
+                ),
+            ),
+            (
+                "cache-from",
+                (
+                    "Use the images from a previous build, given by "
+                    "'cache-from=TAG', as a layer cache.  The images are "
+                    "pulled from the registry first, if they're available."
+                ),
+            ),
+            (
+                "link-resources",
+                (
+                    "Hard link the service files into the build folder instead "
+                    "of copying them.  This only applies when the build folder "
+                    "is on the same device as the service group; files are "
+                    "copied otherwise."
+                ),
+            ),
             (
                 "overwrite",
                 (
@@ -166,6 +572,25 @@ class ImageTarget(Target):
                     "writing over any existing files in the build directory."
                 ),
             ),
+            (
+                "parallel",
+                (
+                    "Build up to N images at the same time with 'parallel=N'.  "
+                    "Using just 'parallel' builds up to "
+                    f"{_DEFAULT_MAX_WORKERS} images at once.  The default "
+                    "behaviour is to build one image at a time."
+                ),
+            ),
+            (
+                "rebuild",
+                (
+                    "Always run `docker build`, even for services whose build "
+                    "context hasn't changed since their image was last built.  "
+                    "Use this to pick up changes outside of the build context, "
+                    "such as an updated base image.  The default behaviour is "
+                    "to reuse the existing image."
+                ),
+            ),
             (
                 "skip-build",
                 (
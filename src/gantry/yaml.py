@@ -1,9 +1,8 @@
 from io import StringIO
 from pathlib import Path
-from typing import Any, cast
+from typing import TextIO
 
 from ruamel.yaml import YAML
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from ._compose_spec import _ComposeBase
 
@@ -24,8 +23,15 @@ class YamlSerializer:
         self._yaml.indent(mapping=4, sequence=6, offset=4)
         self._yaml.default_flow_style = False
 
-        self._header = "\n".join(
-            ["This file has been automatically generated.", "DO NOT MODIFY", " "]
+        # NOTE: The header is written out directly, rather than being attached
+        # as a comment, so the data doesn't need to be copied into ruamel.yaml's
+        # commented containers first.
+        self._header = "".join(
+            [
+                "# This file has been automatically generated.\n",
+                "# DO NOT MODIFY\n",
+                " \n",
+            ]
         )
 
         self._show_header = show_header
@@ -43,11 +49,8 @@ class YamlSerializer:
         str
             string representation
         """
-        output = _prep_data(
-            cast(dict, data), self._header if self._show_header else None
-        )
         with StringIO() as s:
-            self._yaml.dump(output, s)
+            self._dump(data, s)
             return s.getvalue()
 
     def to_file(self, data: dict | _ComposeBase, path: Path):
@@ -60,86 +63,10 @@ class YamlSerializer:
         path : Path
             path to file location
         """
-        output = _prep_data(
-            cast(dict, data), self._header if self._show_header else None
-        )
         with path.open("wt") as f:
-            self._yaml.dump(output, f)
-
-
-def _prep_data(data: dict, header: str | None = None) -> CommentedMap:
-    """Prepare data for serialization.
-
-    Parameters
-    ----------
-    data : dict
-        dictionary to serialize
-    header : str | None, optional
-        a header string to include in the output, by default None
-
-    Returns
-    -------
-    CommentedMap
-        processed data
-    """
-    prepped_data = _prep_dict(data)
-
-    if header:
-        prepped_data.yaml_set_start_comment(header)
-
-    return prepped_data
-
-
-def _prep_dict(data: dict) -> CommentedMap:
-    """Converts an dictionary into its ruamel.yaml commented equivalent.
-
-    Parameters
-    ----------
-    data : dict
-        a dictionary to convert
-
-    Returns
-    -------
-    CommentedMap
-        the coverted entry
-    """
-    out = CommentedMap()
-    for key, value in data.items():
-        match value:
-            case dict(value):
-                out[key] = _prep_dict(value)
-            case list(value):
-                out[key] = _prep_list(value)
-            case _:
-                out[key] = value
-
-    return out
-
-
-def _prep_list(data: list) -> CommentedSeq:
-    """Converts a list into its ruamel.yaml commented equivalent.
-
-    Parameters
-    ----------
-    data : list
-        a list to convert
-
-    Returns
-    -------
-    CommentedSeq
-        the converted list
-    """
-    out = CommentedSeq()
-
-    for item in data:
-        entry: Any
-        match item:
-            case dict(item):
-                entry = _prep_dict(item)
-            case list(item):
-                entry = _prep_list(item)
-            case _:
-                entry = item
-        out.append(entry)
+            self._dump(data, f)
 
-    return out
+    def _dump(self, data: dict | _ComposeBase, stream: TextIO):
+        if self._show_header:
+            stream.write(self._header)
+        self._yaml.dump(data, stream)
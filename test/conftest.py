@@ -1,3 +1,5 @@
+import copy
+import functools
 from pathlib import Path
 import traceback
 from typing import Callable
@@ -9,19 +11,23 @@ from gantry import cli
 from gantry._compose_spec import ComposeFile
 
 import pytest
-from pytest import Config
+from pytest import Config, TempPathFactory
 
 from ruamel.yaml import YAML
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def compile_compose_file(
-    samples_folder: Path, tmp_path: Path
+    samples_folder: Path, tmp_path_factory: TempPathFactory
 ) -> Callable[[str, str], ComposeFile]:
 
+    # Each sample is only compiled once per session.  Tests get their own copy
+    # of the compose file so they can't affect each other.
+    @functools.cache
     def _run_command(folder: str, sample: str) -> ComposeFile:
         runner = CliRunner()
         sample_path = samples_folder / folder / sample
+        tmp_path = tmp_path_factory.mktemp(sample)
         with runner.isolated_filesystem(temp_dir=tmp_path) as td:
             result = runner.invoke(
                 cli.main, ["build", "compose", sample_path.as_posix()]
@@ -40,17 +46,22 @@ def compile_compose_file(
             with compose_file.open("rt") as f:
                 return yaml.load(f)
 
-    return _run_command
+    def _get_compose_file(folder: str, sample: str) -> ComposeFile:
+        return copy.deepcopy(_run_command(folder, sample))
+
+    return _get_compose_file
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def compile_services(
-    samples_folder: Path, tmp_path: Path
+    samples_folder: Path, tmp_path_factory: TempPathFactory
 ) -> Callable[[str, str], Path]:
 
+    @functools.cache
     def _run_command(folder: str, sample: str) -> Path:
         runner = CliRunner()
         sample_path = samples_folder / folder / sample
+        tmp_path = tmp_path_factory.mktemp(sample)
         with runner.isolated_filesystem(temp_dir=tmp_path) as td:
             result = runner.invoke(
                 cli.main, ["build", "compose", sample_path.as_posix()]
@@ -68,6 +79,6 @@ def compile_services(
     return _run_command
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def samples_folder(pytestconfig: Config) -> Path:
     return pytestconfig.invocation_params.dir / "test" / "samples"
@@ -7,6 +7,7 @@ from gantry import cli
 from gantry.schemas import Schema, get_schema
 
 import pytest
+from pytest import TempPathFactory
 
 
 @pytest.mark.parametrize("schema", [Schema.SERVICE, Schema.SERVICE_GROUP])
@@ -21,23 +22,28 @@ def test_schema_dump(schema: Schema):
     assert contents == parsed
 
 
-@pytest.mark.parametrize("schema", [Schema.SERVICE, Schema.SERVICE_GROUP])
-def test_schema_export(schema: Schema, tmp_path: Path):
-    # NOTE: Using parameterization to make it easier to isolate issues by
-    # checking each schema type separately.
-
+@pytest.fixture(scope="module")
+def exported_schemas(tmp_path_factory: TempPathFactory) -> Path:
+    # The export writes out every schema so it only needs to be run once.
     runner = CliRunner()
-    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+    with runner.isolated_filesystem(temp_dir=tmp_path_factory.mktemp("export")) as td:
         result = runner.invoke(cli.main, ["schemas", "export"])
         assert result.exit_code == 0
+        return Path(td) / "schemas"
 
-        # Exported JSON file and directly loaded schema should be identical.
-        json_schema = Path(td) / "schemas" / f"{schema.value}.json"
-        with json_schema.open("rt") as f:
-            parsed = json.load(f)
 
-        contents = get_schema(schema)
-        assert contents == parsed
+@pytest.mark.parametrize("schema", [Schema.SERVICE, Schema.SERVICE_GROUP])
+def test_schema_export(schema: Schema, exported_schemas: Path):
+    # NOTE: Using parameterization to make it easier to isolate issues by
+    # checking each schema type separately.
+
+    # Exported JSON file and directly loaded schema should be identical.
+    json_schema = exported_schemas / f"{schema.value}.json"
+    with json_schema.open("rt") as f:
+        parsed = json.load(f)
+
+    contents = get_schema(schema)
+    assert contents == parsed
 
 
 def test_schema_list():
@@ -1,8 +1,9 @@
+import os
 from typing import Callable
 
 from gantry._compose_spec import ComposeBuild, ComposeFile
 from gantry._types import Path
-from gantry.services import ServiceGroupDefinition
+from gantry.services import ServiceDefinition, ServiceGroupDefinition
 
 import pytest
 
@@ -80,3 +81,45 @@ def test_collection_interface(samples_folder: Path) -> None:
 def test_disable_healthcheck(compile_compose_file: CompileFn) -> None:
     compose_file = compile_compose_file("service-definition", "healthcheck")
     assert compose_file["services"]["disabled"]["healthcheck"]["disable"] is True
+
+
+def test_cached_definition_is_reloaded(tmp_path: Path) -> None:
+    service_file = tmp_path / "service.yml"
+    service_file.write_text("name: first\nimage: hello-world:latest\n")
+
+    service = ServiceDefinition(folder=tmp_path)
+    service.set_metadata("key", "value")
+    assert service.name == "first"
+
+    # Changes to one instance should not leak into the cached definition.
+    assert ServiceDefinition(folder=tmp_path).metadata is None
+
+    info = service_file.stat()
+    service_file.write_text("name: second\nimage: hello-world:latest\n")
+    os.utime(service_file, ns=(info.st_atime_ns, info.st_mtime_ns + 1_000_000_000))
+    assert ServiceDefinition(folder=tmp_path).name == "second"
+
+
+def test_set_metadata() -> None:
+    service = ServiceDefinition(definition={"name": "test", "image": "test:latest"})
+    service.set_metadata("key", "value")
+    assert service.metadata == {"key": "value"}
+
+    with pytest.raises(ValueError):
+        service.set_metadata("key", "other")
+
+    service.set_metadata("key", "other", override=True)
+    assert service.metadata == {"key": "other"}
+
+
+def test_cached_properties(samples_folder: Path) -> None:
+    service_group = ServiceGroupDefinition(
+        samples_folder / "service-definition" / "entrypoints"
+    )
+    assert service_group.services is service_group.services
+    assert not hasattr(service_group, "__dict__")
+
+    service = service_group.services["complex-entrypoint"]
+    assert service.entrypoint is service.entrypoint
+    assert service.volumes is service.volumes
+    assert not hasattr(service, "__dict__")
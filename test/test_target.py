@@ -1,9 +1,24 @@
-from gantry.exceptions import GantryException
+import json
+import os
+from pathlib import Path
+import shutil
+import threading
+
+from gantry.exceptions import GantryException, ServiceImageBuildError
 from gantry.services import ServiceGroupDefinition
-from gantry.targets import Target
+from gantry.targets import ComposeTarget, ImageTarget, Target
+from gantry.targets.image import (
+    _batch_build_output,
+    _CONTEXT_DIGEST_LABEL,
+    _hash_build_context,
+    _ImageBuild,
+    BuildDockerImages,
+)
 
 import pytest
 
+from ruamel.yaml import YAML
+
 
 class MockTarget(Target):
     def __init__(self, *, options: list[str] | None = None) -> None:
@@ -28,7 +43,206 @@ def test_target_with_valid_opts() -> None:
     assert target.second == 2
 
 
-@pytest.mark.parametrize("arg", ["", "abc", "first=second=3"])
+def test_target_opt_value_with_equals() -> None:
+    target = MockTarget(options=["first=a=b", "second=2"])
+    assert target._parsed_options["first"] == "a=b"
+
+
+@pytest.mark.parametrize("arg", ["", "abc", "=3"])
 def test_target_with_invalid_opts(arg: str) -> None:
     with pytest.raises(GantryException):
         MockTarget(options=[arg])
+
+
+def test_compose_target_json_output(samples_folder: Path, tmp_path: Path) -> None:
+    service_group = ServiceGroupDefinition(
+        samples_folder / "service-definition" / "build-args"
+    )
+
+    ComposeTarget("test", tmp_path / "yaml").build(service_group)
+    ComposeTarget("test", tmp_path / "json", options=["json"]).build(service_group)
+
+    yaml_file = tmp_path / "yaml" / service_group.name / "docker-compose.yml"
+    json_file = tmp_path / "json" / service_group.name / "docker-compose.yml"
+
+    with json_file.open("rt") as f:
+        as_json = json.load(f)
+
+    assert as_json == YAML(typ="safe").load(yaml_file)
+    assert YAML(typ="safe").load(json_file) == as_json
+
+
+def test_batched_build_output() -> None:
+    output = [{"stream": f"line {i}"} for i in range(100)]
+    batches = list(_batch_build_output(iter(output), max_size=8))
+    assert all(len(batch) <= 8 for batch in batches)
+    assert [item for batch in batches for item in batch] == output
+
+
+@pytest.mark.parametrize("value", ["abc", "0", "-1"])
+def test_image_target_invalid_parallel_opt(value: str, tmp_path: Path) -> None:
+    with pytest.raises(GantryException):
+        ImageTarget("test", None, "1", tmp_path, options=[f"parallel={value}"])
+
+
+def test_compose_file_not_rewritten_if_unchanged(
+    samples_folder: Path, tmp_path: Path
+) -> None:
+    service_group = ServiceGroupDefinition(
+        samples_folder / "service-definition" / "build-args"
+    )
+    target = ComposeTarget("test", tmp_path, options=["overwrite"])
+    compose_file = tmp_path / service_group.name / "docker-compose.yml"
+
+    target.build(service_group)
+    first = compose_file.stat().st_mtime_ns
+    os.utime(compose_file, ns=(first - 1_000_000_000, first - 1_000_000_000))
+
+    target.build(service_group)
+    assert compose_file.stat().st_mtime_ns == first - 1_000_000_000
+
+
+@pytest.mark.parametrize(
+    "opt",
+    [
+        "cache-from",
+        "build-network",
+        "build-shm-size",
+        "build-shm-size=abc",
+        "build-shm-size=-1",
+    ],
+)
+def test_image_target_invalid_opt_values(opt: str, tmp_path: Path) -> None:
+    with pytest.raises(GantryException):
+        ImageTarget("test", None, "1", tmp_path, options=[opt])
+
+
+def test_image_target_adds_dockerignore(samples_folder: Path, tmp_path: Path) -> None:
+    service_group = ServiceGroupDefinition(
+        samples_folder / "service-definition" / "build-args"
+    )
+    ImageTarget("test", None, "1", tmp_path, options=["skip-build"]).build(
+        service_group
+    )
+
+    for service in service_group:
+        ignore_file = tmp_path / service_group.name / service.name / ".dockerignore"
+        assert "**/.git" in ignore_file.read_text().splitlines()
+
+
+def test_build_context_digest(tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "Dockerfile").write_text("FROM scratch\n")
+    (tmp_path / "sub" / "file.txt").write_text("contents")
+
+    digest = _hash_build_context(os.fspath(tmp_path))
+    os.utime(tmp_path / "Dockerfile", ns=(0, 0))
+    assert _hash_build_context(os.fspath(tmp_path)) == digest
+
+    (tmp_path / "sub" / "file.txt").write_text("changed")
+    assert _hash_build_context(os.fspath(tmp_path)) != digest
+
+
+def test_rebuild_with_linked_resources(samples_folder: Path, tmp_path: Path) -> None:
+    services_folder = tmp_path / "services"
+    shutil.copytree(
+        samples_folder / "service-definition" / "build-args", services_folder
+    )
+    (services_folder / "no-args" / "Dockerfile").write_text("FROM scratch\n")
+
+    service_group = ServiceGroupDefinition(services_folder)
+    target = ImageTarget(
+        "test",
+        None,
+        "1",
+        tmp_path / "build",
+        options=["link-resources", "overwrite", "skip-build"],
+    )
+    target.build(service_group)
+    target.build(service_group)
+
+    dockerfile = tmp_path / "build" / service_group.name / "no-args" / "Dockerfile"
+    assert dockerfile.read_text() == "FROM scratch\n"
+
+
+class _StubApi:
+    def __init__(self, digests: dict[str, str]) -> None:
+        self.built = False
+        self.digests = digests
+        self.pulled: list[str] = []
+        self.tagged: list[str] = []
+
+    def inspect_image(self, image: str) -> dict:
+        return {"Config": {"Labels": {_CONTEXT_DIGEST_LABEL: self.digests.get(image)}}}
+
+    def pull(self, image: str) -> None:
+        self.pulled.append(image)
+
+    def tag(self, image: str, repository: str, tag: str) -> None:
+        self.tagged.append(f"{repository}:{tag}")
+
+    def build(self, **kwargs) -> list[dict]:
+        self.built = True
+        return [{"stream": "done"}]
+
+
+class _StubReporter:
+    def print_output(self, msg: str) -> None: ...
+
+    def print_error(self, msg: str) -> None: ...
+
+
+@pytest.mark.parametrize("rebuild", [False, True])
+def test_unchanged_context_reuses_image(rebuild: bool, tmp_path: Path) -> None:
+    (tmp_path / "Dockerfile").write_text("FROM scratch\n")
+    api = _StubApi({"test:1": _hash_build_context(os.fspath(tmp_path))})
+
+    builder = BuildDockerImages(tmp_path, None, "1", rebuild=rebuild)
+    build = _ImageBuild("test", "test:1", os.fspath(tmp_path), None)
+    builder._build_image(api, build, _StubReporter())  # type: ignore
+    assert api.built == rebuild
+
+
+def test_cache_image_only_pulled_if_needed(tmp_path: Path) -> None:
+    (tmp_path / "Dockerfile").write_text("FROM scratch\n")
+    digest = _hash_build_context(os.fspath(tmp_path))
+    builder = BuildDockerImages(tmp_path, None, "1", cache_tag="cache")
+    build = _ImageBuild("test", "test:1", os.fspath(tmp_path), "test:cache")
+
+    # Nothing is pulled if the local image is already up to date.
+    api = _StubApi({"test:1": digest})
+    builder._build_image(api, build, _StubReporter())  # type: ignore
+    assert api.pulled == []
+    assert not api.built
+
+    # Otherwise the cache image is pulled and, since it matches, re-tagged.
+    api = _StubApi({"test:cache": digest})
+    builder._build_image(api, build, _StubReporter())  # type: ignore
+    assert api.pulled == ["test:cache"]
+    assert api.tagged == ["test:1"]
+    assert not api.built
+
+
+def test_failed_build_doesnt_wait_for_running_builds(tmp_path: Path) -> None:
+    release = threading.Event()
+    finished = threading.Event()
+
+    class _Builder(BuildDockerImages):
+        def _build_image(self, api, build, reporter, *, prefix="") -> None:
+            if build.service == "fails":
+                raise ServiceImageBuildError()
+            release.wait(timeout=10)
+            finished.set()
+
+    builds = [
+        _ImageBuild("slow", "slow:1", os.fspath(tmp_path), None),
+        _ImageBuild("fails", "fails:1", os.fspath(tmp_path), None),
+    ]
+
+    builder = _Builder(tmp_path, None, "1", max_workers=2)
+    try:
+        with pytest.raises(ServiceImageBuildError):
+            builder._build_concurrently(None, builds)
+        assert not finished.is_set()
+    finally:
+        release.set()
@@ -1,7 +1,10 @@
 from pathlib import Path
-from typing import Callable
+import shutil
+import stat
+from typing import Any, Callable
 
 from gantry._compose_spec import ComposeFile
+from gantry.routers import TraefikRoutingProvider
 from gantry.routers.provider import DEFAULT_SERVICE_NAME
 
 from ruamel.yaml import YAML
@@ -11,6 +14,14 @@ import pytest
 CompileFn = Callable[[str, str], ComposeFile]
 ServicesFn = Callable[[str, str], Path]
 
+# The tests only inspect the generated data so the (faster) safe loader is used
+# instead of the default round-trip loader.
+_yaml = YAML(typ="safe")
+
+
+def _load_yaml(path: Path) -> Any:
+    return _yaml.load(path)
+
 
 def test_router_config_render(compile_services: ServicesFn):
     """Check that the router's configuration is rendered correctly."""
@@ -18,17 +29,13 @@ def test_router_config_render(compile_services: ServicesFn):
     assert (output_path / "traefik-custom.yml").exists()
 
     # Check that the traefik file sets the network correctly.
-    reader = YAML()
-    with (output_path / "traefik-custom.yml").open("rt") as f:
-        traefik_file = reader.load(f)
+    traefik_file = _load_yaml(output_path / "traefik-custom.yml")
 
     network = traefik_file["providers"]["docker"]["network"]
     assert network == "test"
 
     # Check that the compose file references the correct traefik file.
-    reader = YAML()
-    with (output_path / "docker-compose.yml").open("rt") as f:
-        compose_spec: ComposeFile = reader.load(f)
+    compose_spec: ComposeFile = _load_yaml(output_path / "docker-compose.yml")
 
     volumes = compose_spec["services"][DEFAULT_SERVICE_NAME]["volumes"]
     expected_volumes = [
@@ -42,9 +49,7 @@ def test_router_default_config(compile_services: ServicesFn) -> None:
     """Check that the default configuration is generated correctly."""
     output_path = compile_services("router", "traefik-default")
 
-    reader = YAML()
-    with (output_path / "docker-compose.yml").open("rt") as f:
-        compose_spec: ComposeFile = reader.load(f)
+    compose_spec: ComposeFile = _load_yaml(output_path / "docker-compose.yml")
 
     # Check that all ports are expected
     ports = compose_spec["services"][DEFAULT_SERVICE_NAME]["ports"]
@@ -70,9 +75,7 @@ def test_router_dynamic_config(compile_services: ServicesFn):
     output_path = compile_services("router", "traefik-dynamic-config")
 
     # Check that the dynamic configuration folder will be mounted as a volume.
-    reader = YAML()
-    with (output_path / "docker-compose.yml").open("rt") as f:
-        compose_spec: ComposeFile = reader.load(f)
+    compose_spec: ComposeFile = _load_yaml(output_path / "docker-compose.yml")
 
     volumes = compose_spec["services"][DEFAULT_SERVICE_NAME]["volumes"]
     assert "./configuration:/configuration:ro" in volumes
@@ -81,21 +84,35 @@ def test_router_dynamic_config(compile_services: ServicesFn):
     certificates_file = output_path / "configuration" / "certificates.yml"
     assert certificates_file.exists()
 
-    reader = YAML()
-    with certificates_file.open("rt") as f:
-        certificates = reader.load(f)
+    certificates = _load_yaml(certificates_file)
 
     assert certificates["tls"]["certificates"][0]["keyFile"] == "my.key"
     assert certificates["tls"]["certificates"][0]["certFile"] == "my.cert"
 
 
+def test_router_dynamic_config_permissions(samples_folder: Path, tmp_path: Path):
+    """Ensure the dynamic configuration files keep their permissions."""
+    services_folder = tmp_path / "services"
+    shutil.copytree(
+        samples_folder / "router" / "traefik-dynamic-config", services_folder
+    )
+
+    key_file = services_folder / "configuration" / "my.key"
+    key_file.write_text("not a real key")
+    key_file.chmod(0o600)
+
+    router = TraefikRoutingProvider({"dynamic-config": "./configuration"})
+    router.copy_resources(services_folder, tmp_path / "output")
+
+    output_file = tmp_path / "output" / "configuration" / "my.key"
+    assert stat.S_IMODE(output_file.stat().st_mode) == 0o600
+
+
 def test_router_enable_dashboard(compile_services: CompileFn) -> None:
     """Ensure the Traefik dashboard endpoints are setup correctly when enabled."""
     output_path = compile_services("router", "traefik-enable-dashboard")
 
-    reader = YAML()
-    with (output_path / "docker-compose.yml").open("rt") as f:
-        compose_spec: ComposeFile = reader.load(f)
+    compose_spec: ComposeFile = _load_yaml(output_path / "docker-compose.yml")
 
     labels = compose_spec["services"][DEFAULT_SERVICE_NAME]["labels"]
     expected_labels = {